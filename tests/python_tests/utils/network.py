@@ -1,9 +1,18 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import os
+import random
+import tempfile
+import threading
 import time
 import logging
+from dataclasses import dataclass, field
+import huggingface_hub
+import requests
+import urllib3
 from huggingface_hub.utils import HfHubHTTPError
+from requests.adapters import HTTPAdapter
 from subprocess import CalledProcessError # nosec B404
 from requests.exceptions import RequestException
 
@@ -11,6 +20,200 @@ from requests.exceptions import RequestException
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bound every wrapped call instead of waiting on OS TCP keepalive (minutes)
+# when an endpoint hangs, so the retry machinery can actually kick in.
+DEFAULT_TIMEOUT = (5, 30)  # (connect, read) seconds
+
+# huggingface_hub honors this for its own requests.
+os.environ.setdefault("HF_HUB_DOWNLOAD_TIMEOUT", "30")
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies DEFAULT_TIMEOUT unless the caller passes one."""
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = DEFAULT_TIMEOUT
+        return super().send(request, **kwargs)
+
+# Cache only small config/tokenizer-style responses. Model weights are
+# already cached on disk by huggingface_hub; buffering them into SQLite blobs
+# would duplicate gigabytes in an unbounded database and break on the SQLite
+# blob size limit.
+MAX_CACHED_RESPONSE_SIZE = 1024 * 1024
+
+
+def _should_cache_response(response):
+    try:
+        size = int(response.headers.get("Content-Length", 0))
+    except (TypeError, ValueError):
+        return False
+    return 0 < size <= MAX_CACHED_RESPONSE_SIZE
+
+
+def _build_session():
+    """
+    Builds the shared HTTP session.
+
+    When requests_cache is installed, small idempotent GET/HEAD responses are
+    cached in SQLite with conditional revalidation (ETag/Cache-Control), so
+    repeated CI runs skip re-downloading unchanged artifacts. The cache
+    location can be overridden with the OV_HTTP_CACHE environment variable;
+    OV_HTTP_CACHE=0 disables caching.
+    """
+    cache_name = os.environ.get(
+        "OV_HTTP_CACHE", os.path.join(tempfile.gettempdir(), "ov_genai_http_cache")
+    )
+    if cache_name != "0":
+        try:
+            import requests_cache
+            return requests_cache.CachedSession(
+                cache_name=cache_name,
+                backend="sqlite",
+                cache_control=True,
+                expire_after=requests_cache.NEVER_EXPIRE,
+                allowable_methods=("GET", "HEAD"),
+                filter_fn=_should_cache_response,
+            )
+        except ImportError:
+            logger.info("requests_cache is not installed, HTTP responses will not be cached.")
+    return requests.Session()
+
+
+# Shared pooled session so repeated requests to the same host (HF Hub mostly)
+# reuse TCP connections and TLS sessions instead of paying a handshake per call.
+# max_retries=0 because retry_request owns the retry policy.
+_SESSION = _build_session()
+_adapter = _TimeoutHTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+# Route huggingface_hub traffic through the same pool.
+huggingface_hub.configure_http_backend(backend_factory=lambda: _SESSION)
+
+
+def retry_request_get(url, **kwargs):
+    """Performs a GET through the shared pooled session, wrapped by retry_request."""
+    return retry_request(lambda: _SESSION.get(url, **kwargs))
+
+# Backoff parameters for "full jitter" truncated exponential backoff.
+# Jitter spreads retries of parallel test workers over time instead of
+# hammering HF Hub on the same 1s/2s/4s/... boundaries.
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+
+# SystemRandom avoids correlated pseudo-random sequences across workers
+# that fork or start from the same seed.
+_random = random.SystemRandom()
+
+
+# Circuit breaker parameters: trip to open after FAIL_THRESHOLD consecutive
+# failures, fail fast for SLEEP_WINDOW seconds, then let one probe through
+# (half-open) before closing again. This turns a globally broken HF endpoint
+# into an immediate error instead of a full retry ladder per call.
+FAIL_THRESHOLD = 5
+SLEEP_WINDOW = 30.0
+
+
+class CircuitOpenError(Exception):
+    """Raised when the network circuit breaker is open and calls fail fast."""
+
+
+@dataclass
+class _Breaker:
+    fail_count: int = 0
+    opened_at: float = 0.0
+    state: str = "closed"  # one of "closed", "open", "half_open"
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+_breaker = _Breaker()
+
+
+def reset_breaker():
+    """Resets the circuit breaker to its closed state. Intended for pytest fixtures."""
+    with _breaker.lock:
+        _breaker.fail_count = 0
+        _breaker.opened_at = 0.0
+        _breaker.state = "closed"
+
+
+def _check_breaker():
+    with _breaker.lock:
+        if _breaker.state == "open":
+            if time.monotonic() - _breaker.opened_at < SLEEP_WINDOW:
+                raise CircuitOpenError(
+                    f"Network circuit breaker is open after {_breaker.fail_count} consecutive failures, "
+                    f"failing fast for {SLEEP_WINDOW} seconds."
+                )
+            # Sleep window elapsed - allow a single probe request.
+            _breaker.state = "half_open"
+
+
+def _record_success():
+    with _breaker.lock:
+        _breaker.fail_count = 0
+        _breaker.state = "closed"
+
+
+def _record_failure():
+    with _breaker.lock:
+        _breaker.fail_count += 1
+        if _breaker.state == "half_open" or _breaker.fail_count >= FAIL_THRESHOLD:
+            _breaker.state = "open"
+            _breaker.opened_at = time.monotonic()
+
+
+# CalledProcessError is retried only when the subprocess output mentions one of
+# these network failures (e.g. optimum-cli export hitting a flaky HF endpoint).
+NETWORK_ERROR_PATTERNS = [
+    "ConnectionError",
+    "Timeout",
+    "Time-out",
+    "ServiceUnavailable",
+    "InternalServerError",
+    "OSError",
+    "HTTPError",
+]
+
+# HTTP status codes worth retrying: request timeout, rate limiting and
+# transient server-side errors.
+RETRIABLE_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+
+# RequestException covers ConnectionError, Timeout/ReadTimeout, SSLError and
+# ChunkedEncodingError; urllib3.ProtocolError can escape the requests wrapper
+# on aborted chunked transfers.
+_RETRIABLE_EXCEPTIONS = (
+    RequestException,
+    urllib3.exceptions.ProtocolError,
+)
+
+
+def _is_retriable(e):
+    """Returns True if the exception looks like a transient network failure."""
+    if isinstance(e, CalledProcessError):
+        error_output = (e.stdout or "") + (e.stderr or "")
+        return bool(error_output) and any(pattern in error_output for pattern in NETWORK_ERROR_PATTERNS)
+    if isinstance(e, HfHubHTTPError):
+        response = getattr(e, "response", None)
+        return response is None or response.status_code in RETRIABLE_STATUS_CODES
+    return isinstance(e, _RETRIABLE_EXCEPTIONS)
+
+
+def _retry_after_from_exception(e):
+    """Returns the server-requested delay in seconds from a Retry-After header, or None."""
+    response = getattr(e, "response", None)
+    if response is None or response.status_code not in (429, 503):
+        return None
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is None:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        return None
+
+
 def retry_request(func, retries=7):
     """
     Retries a function that makes a request up to a specified number of times.
@@ -22,29 +225,25 @@ def retry_request(func, retries=7):
     Returns:
     Any: The return value of the function `func` if it succeeds.
     """
-    network_error_patterns = [
-        "ConnectionError",
-        "Timeout",
-        "Time-out",
-        "ServiceUnavailable",
-        "InternalServerError",
-        "OSError",
-        "HTTPError",
-    ]
-
     for attempt in range(retries):
+        _check_breaker()
         try:
-            return func()
-        except (CalledProcessError, RequestException, HfHubHTTPError) as e:
+            result = func()
+        except Exception as e:
+            if not _is_retriable(e):
+                raise
             if isinstance(e, CalledProcessError):
-                error_output = (e.stdout or "") + (e.stderr or "")
-                if error_output and any(pattern in error_output for pattern in network_error_patterns):
-                    logger.warning(f"CalledProcessError occurred: {error_output}")
-                else:
-                    raise
+                logger.warning(f"CalledProcessError occurred: {(e.stdout or '') + (e.stderr or '')}")
+            _record_failure()
             if attempt < retries - 1:
-                timeout = 2 ** attempt
-                logger.info(f"Attempt {attempt + 1} failed. Retrying in {timeout} seconds.")
+                timeout = _random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+                retry_after = _retry_after_from_exception(e)
+                if retry_after is not None:
+                    timeout = retry_after
+                logger.info(f"Attempt {attempt + 1} failed. Retrying in {timeout:.1f} seconds.")
                 time.sleep(timeout)
             else:
                 raise
+        else:
+            _record_success()
+            return result
@@ -3,7 +3,7 @@ import os
 import tempfile
 
 import whowhatbench
-from whowhatbench.wwb import load_dataset
+from datasets import load_dataset
 from optimum.intel.openvino import OVModelForCausalLM
 
 from openvino_genai import (
@@ -1,13 +1,23 @@
-from .registry import register_evaluator, EVALUATOR_REGISTRY
-from .text_evaluator import TextEvaluator
-from .text_evaluator import TextEvaluator as Evaluator
-from .text2image_evaluator import Text2ImageEvaluator
-from .visualtext_evaluator import VisualTextEvaluator
-from .im2im_evaluator import Image2ImageEvaluator
-from .inpaint_evaluator import InpaintingEvaluator
-from .embeddings_evaluator import EmbeddingsEvaluator
-from .reranking_evaluator import RerankingEvaluator
-from .text2video_evaluator import Text2VideoEvaluator
+import importlib
+
+# Evaluator classes are resolved lazily (PEP 562) so that importing the
+# package - which happens before whowhatbench.wwb:main can even parse
+# arguments - does not pay the multi-second torch/transformers import cost
+# of every evaluator module. EVALUATOR_REGISTRY is populated as a side
+# effect of importing the evaluator modules, so accessing it imports them
+# all first.
+
+_EVALUATOR_MODULES = {
+    "TextEvaluator": "whowhatbench.text_evaluator",
+    "Evaluator": "whowhatbench.text_evaluator",
+    "Text2ImageEvaluator": "whowhatbench.text2image_evaluator",
+    "VisualTextEvaluator": "whowhatbench.visualtext_evaluator",
+    "Image2ImageEvaluator": "whowhatbench.im2im_evaluator",
+    "InpaintingEvaluator": "whowhatbench.inpaint_evaluator",
+    "EmbeddingsEvaluator": "whowhatbench.embeddings_evaluator",
+    "RerankingEvaluator": "whowhatbench.reranking_evaluator",
+    "Text2VideoEvaluator": "whowhatbench.text2video_evaluator",
+}
 
 
 __all__ = [
@@ -23,3 +33,19 @@ __all__ = [
     "Text2VideoEvaluator",
     "EVALUATOR_REGISTRY",
 ]
+
+
+def __getattr__(name):
+    if name == "register_evaluator":
+        from .registry import register_evaluator as value
+    elif name == "EVALUATOR_REGISTRY":
+        for module_name in set(_EVALUATOR_MODULES.values()):
+            importlib.import_module(module_name)
+        from .registry import EVALUATOR_REGISTRY as value
+    elif name in _EVALUATOR_MODULES:
+        module = importlib.import_module(_EVALUATOR_MODULES[name])
+        value = getattr(module, "TextEvaluator" if name == "Evaluator" else name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
@@ -24,6 +24,18 @@ from transformers.image_utils import load_image
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# orjson parses JSON several times faster than the stdlib; fall back to the
+# stdlib when it is not installed. orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so one exception type covers both parsers.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
 
 def new_randn_tensor(
     shape: Union[tuple, list],
@@ -130,20 +142,16 @@ def get_ignore_parameters_flag():
 def get_json_config(config):
     if config is None or (isinstance(config, str) and config.strip() == ""):
         raise ValueError("Config must be a non-empty string or path to a JSON file.")
-    json_config = {}
-    if Path(config).is_file():
-        with open(config, 'r') as f:
-            try:
-                json_config = json.load(f)
-            except json.JSONDecodeError:
-                raise RuntimeError(f'Failed to parse JSON from file: {config}')
-    else:
+    path = Path(config)
+    if path.is_file():
         try:
-            json_config = json.loads(config)
-        except json.JSONDecodeError:
-            raise RuntimeError(f'Failed to parse JSON config: {config}')
-
-    return json_config
+            return _json_loads(path.read_bytes())
+        except _JSONDecodeError:
+            raise RuntimeError(f'Failed to parse JSON from file: {config}')
+    try:
+        return _json_loads(config)
+    except _JSONDecodeError:
+        raise RuntimeError(f'Failed to parse JSON config: {config}')
 
 
 # preapre default dataset for visualtext(VLM) evalutor
@@ -1,20 +1,16 @@
 import argparse
+import asyncio
+import concurrent.futures
 import difflib
-import numpy as np
+import functools
+import itertools
 import logging
 import os
 
-from transformers import AutoTokenizer, AutoProcessor, AutoConfig
-import openvino as ov
-
-import pandas as pd
-from datasets import load_dataset
-from PIL import Image
-
-from whowhatbench.model_loaders import load_model
-from whowhatbench import EVALUATOR_REGISTRY
-from whowhatbench.visualtext_evaluator import fix_phi3_v_eos_token_id
-from whowhatbench.utils import get_json_config
+# Heavy modules (transformers, openvino, pandas, datasets, PIL and the
+# whowhatbench evaluator/model-loader modules that pull them in) are imported
+# inside the functions that need them so that argument parsing and error
+# paths do not pay several seconds of import cost.
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -191,6 +187,12 @@ def parse_args():
         action="store_true",
         help="Use llama-cpp-python to instantiate the model.",
     )
+    parser.add_argument(
+        "--no-parallel-load",
+        action="store_true",
+        help="Do not load the target model in parallel with the base model."
+        " Lowers peak memory on constrained hosts at the cost of sequential load time.",
+    )
     parser.add_argument(
         "--image-size",
         type=int,
@@ -352,9 +354,16 @@ def check_args(args):
 def load_prompts(args):
     if args.dataset is None:
         return None
+    from datasets import load_dataset
+
     split = "validation"
     if args.split is not None:
         split = args.split
+    sliced_split = split
+    if args.num_samples is not None and "[" not in split:
+        # Push the sample bound down into the split so only the needed rows
+        # are decoded instead of materializing the full split in RAM.
+        sliced_split = f"{split}[:{args.num_samples}]"
     if "," in args.dataset:
         path_name = args.dataset.split(",")
         path = path_name[0]
@@ -362,51 +371,85 @@ def load_prompts(args):
     else:
         path = args.dataset
         name = None
-    data = load_dataset(path=path, name=name, split=split)
+    try:
+        data = load_dataset(path=path, name=name, split=sliced_split)
+    except ValueError:
+        if sliced_split == split:
+            raise
+        # datasets rejects absolute slices that exceed the split size;
+        # the evaluators clamp num_samples themselves, so fall back to
+        # loading the full split.
+        data = load_dataset(path=path, name=name, split=split)
+
+    # Column access already yields a Python list for in-memory datasets;
+    # re-wrapping it in list() forced a second full pass. pyarrow-backed
+    # columns convert once via to_pylist.
+    col = data[args.dataset_field]
+    if hasattr(col, "to_pylist"):
+        prompts = col.to_pylist()
+    elif isinstance(col, list):
+        prompts = col
+    else:
+        prompts = list(col)
+    return {"prompts": prompts}
 
-    res = data[args.dataset_field]
-    res = {"prompts": list(res)}
-    return res
 
+# Base and target models frequently share the same HF id (e.g. only the
+# quantization differs), so memoize the deserialization-heavy loaders to
+# avoid reading the same files twice within one run.
+@functools.lru_cache(maxsize=8)
+def _cached_tokenizer(model_id, trust_remote_code=True, gguf_file=None):
+    from transformers import AutoTokenizer
+    kwargs = {"gguf_file": gguf_file} if gguf_file else {}
+    return AutoTokenizer.from_pretrained(model_id, trust_remote_code=trust_remote_code, **kwargs)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_config(model_id, trust_remote_code=True):
+    from transformers import AutoConfig
+    return AutoConfig.from_pretrained(model_id, trust_remote_code=trust_remote_code)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_processor(model_id, trust_remote_code=True):
+    from transformers import AutoProcessor
+    return AutoProcessor.from_pretrained(model_id, trust_remote_code=trust_remote_code)
 
-def load_tokenizer(args):
-    # Define kwargs based on args attributes
-    kwargs = {}
-    if args.gguf_file:
-        kwargs['gguf_file'] = args.gguf_file
 
+def load_tokenizer(args):
     tokenizer = None
     if args.tokenizer is not None:
         if args.llamacpp:
             from llama_cpp.llama_tokenizer import LlamaHFTokenizer
+            kwargs = {'gguf_file': args.gguf_file} if args.gguf_file else {}
             tokenizer = LlamaHFTokenizer.from_pretrained(args.tokenizer, **kwargs)
         else:
             try:
-                tokenizer = AutoTokenizer.from_pretrained(
-                    args.tokenizer, trust_remote_code=False, **kwargs
+                tokenizer = _cached_tokenizer(
+                    args.tokenizer, trust_remote_code=False, gguf_file=args.gguf_file
                 )
             except Exception:
-                tokenizer = AutoTokenizer.from_pretrained(
-                    args.tokenizer, trust_remote_code=True, **kwargs
+                tokenizer = _cached_tokenizer(
+                    args.tokenizer, trust_remote_code=True, gguf_file=args.gguf_file
                 )
     elif args.base_model is not None:
         try:
-            tokenizer = AutoTokenizer.from_pretrained(
-                args.base_model, trust_remote_code=False, **kwargs
+            tokenizer = _cached_tokenizer(
+                args.base_model, trust_remote_code=False, gguf_file=args.gguf_file
             )
         except Exception:
-            tokenizer = AutoTokenizer.from_pretrained(
-                args.base_model, trust_remote_code=True, **kwargs
+            tokenizer = _cached_tokenizer(
+                args.base_model, trust_remote_code=True, gguf_file=args.gguf_file
             )
     elif args.target_model is not None:
         try:
-            tokenizer = AutoTokenizer.from_pretrained(
-                args.target_model, trust_remote_code=False, **kwargs
+            tokenizer = _cached_tokenizer(
+                args.target_model, trust_remote_code=False, gguf_file=args.gguf_file
             )
         except Exception:
             try:
-                tokenizer = AutoTokenizer.from_pretrained(
-                    args.target_model, trust_remote_code=True, **kwargs
+                tokenizer = _cached_tokenizer(
+                    args.target_model, trust_remote_code=True, gguf_file=args.gguf_file
                 )
             except Exception:
                 logger.error(f"Cannot load the tokenizer for model type \"{args.model_type}\" from {args.target_model}")
@@ -421,9 +464,9 @@ def load_processor(args):
         return None, None
 
     try:
-        config = AutoConfig.from_pretrained(model_id, trust_remote_code=False)
+        config = _cached_config(model_id, trust_remote_code=False)
     except Exception:
-        config = AutoConfig.from_pretrained(model_id, trust_remote_code=True)
+        config = _cached_config(model_id, trust_remote_code=True)
     if "llava-qwen" in config.model_type:
         preprocessor_id = config.mm_vision_tower
     else:
@@ -442,7 +485,7 @@ def load_processor(args):
                     return {"pixel_values": self.processor(images, self.config).to(dtype=self.model_dtype)}
 
             model_id = "qnguyen3/nanoLLaVA"
-            from transformers import AutoModelForCausalLM
+            from transformers import AutoModelForCausalLM, AutoTokenizer
             model = AutoModelForCausalLM.from_pretrained(
                 model_id,
                 device_map='auto',
@@ -453,15 +496,19 @@ def load_processor(args):
             preprocessor = NanollavaProcessorWrapper(model.process_images, model.config, model.dtype, tokenizer)
             config = model.config
         else:
-            preprocessor = AutoProcessor.from_pretrained(preprocessor_id, trust_remote_code=False)
+            preprocessor = _cached_processor(preprocessor_id, trust_remote_code=False)
     except Exception:
-        preprocessor = AutoProcessor.from_pretrained(preprocessor_id, trust_remote_code=True)
+        preprocessor = _cached_processor(preprocessor_id, trust_remote_code=True)
     return preprocessor, config
 
 
-def diff_strings(a: str, b: str, *, use_loguru_colors: bool = False) -> str:
-    output = []
-    matcher = difflib.SequenceMatcher(None, a, b)
+def diff_strings(a: str, b: str, *, matcher: difflib.SequenceMatcher = None, use_loguru_colors: bool = False) -> str:
+    # Callers diffing many pairs can pass one matcher and reuse it via
+    # set_seqs instead of constructing a SequenceMatcher per pair. autojunk
+    # is disabled since its heuristic only slows down short model outputs.
+    if matcher is None:
+        matcher = difflib.SequenceMatcher(autojunk=False)
+    matcher.set_seqs(a, b)
     if use_loguru_colors:
         green = "<GREEN><black>"
         red = "<RED><black>"
@@ -473,17 +520,20 @@ def diff_strings(a: str, b: str, *, use_loguru_colors: bool = False) -> str:
         endgreen = "\x1b[0m"
         endred = "\x1b[0m"
 
-    for opcode, a0, a1, b0, b1 in matcher.get_opcodes():
-        if opcode == "equal":
-            output.append(a[a0:a1])
-        elif opcode == "insert":
-            output.append(f"{green}{b[b0:b1]}{endgreen}")
-        elif opcode == "delete":
-            output.append(f"{red}{a[a0:a1]}{endred}")
-        elif opcode == "replace":
-            output.append(f"{green}{b[b0:b1]}{endgreen}")
-            output.append(f"{red}{a[a0:a1]}{endred}")
-    return "".join(output)
+    # Dispatch to raw segments per opcode so the final join is the only
+    # concatenation; per-opcode f-string formatting dominated on long texts
+    # with many small opcodes.
+    ops = {
+        "equal": lambda a0, a1, b0, b1: (a[a0:a1],),
+        "insert": lambda a0, a1, b0, b1: (green, b[b0:b1], endgreen),
+        "delete": lambda a0, a1, b0, b1: (red, a[a0:a1], endred),
+        "replace": lambda a0, a1, b0, b1: (green, b[b0:b1], endgreen, red, a[a0:a1], endred),
+    }
+    return "".join(
+        segment
+        for opcode, a0, a1, b0, b1 in matcher.get_opcodes()
+        for segment in ops[opcode](a0, a1, b0, b1)
+    )
 
 
 def genai_gen_text(model, tokenizer, question, max_new_tokens, skip_question, use_chat_template=False, empty_adapters=False,
@@ -520,33 +570,92 @@ def llamacpp_gen_text(model, tokenizer, question, max_new_tokens, skip_question,
         return text
 
 
+def _image_to_tensor(image):
+    """
+    Wraps an image into a batched ov.Tensor, sharing the numpy buffer when
+    possible. Returns (tensor, array): a shared-memory Tensor does not own the
+    host buffer, so the caller must keep the returned array alive until the
+    tensor has been consumed (i.e. until model.generate returns).
+    """
+    import numpy as np
+    import openvino as ov
+
+    # np.asarray skips the pixel copy that np.array makes for numpy-backed
+    # inputs, and reshape adds the batch dim without an extra allocation.
+    # With shared_memory=True OpenVINO points into the numpy buffer instead
+    # of copying it; fall back to a copying Tensor for read-only or
+    # non-contiguous buffers.
+    arr = np.asarray(image)
+    batched = arr.reshape((1,) + arr.shape)
+    if batched.flags["C_CONTIGUOUS"] and batched.flags["WRITEABLE"]:
+        return ov.Tensor(batched, shared_memory=True), batched
+    return ov.Tensor(batched), batched
+
+
+def _to_pil(image_tensor):
+    """
+    Converts a generated image tensor to PIL, bypassing numpy array-interface
+    detection for the contiguous uint8 HWC RGB tensors the pipelines produce.
+    Falls back to Image.fromarray for anything unexpected.
+    """
+    import numpy as np
+    from PIL import Image
+
+    arr = image_tensor.data[0]
+    if arr.ndim == 3 and arr.shape[2] == 3 and arr.dtype == np.uint8 and arr.flags["C_CONTIGUOUS"]:
+        return Image.frombuffer("RGB", (arr.shape[1], arr.shape[0]), arr, "raw", "RGB", 0, 1)
+    return Image.fromarray(arr)
+
+
+def _make_image_gen(model):
+    """Returns a generate closure with the resolution branch resolved once."""
+    if model.resolution is not None and model.resolution[0] is not None:
+        width, height = model.resolution[0], model.resolution[1]
+
+        def gen(prompt, num_inference_steps, generator, **kwargs):
+            return model.generate(
+                prompt,
+                width=width,
+                height=height,
+                num_inference_steps=num_inference_steps,
+                generator=generator,
+                **kwargs,
+            )
+    else:
+        def gen(prompt, num_inference_steps, generator, **kwargs):
+            return model.generate(
+                prompt,
+                num_inference_steps=num_inference_steps,
+                generator=generator,
+                **kwargs,
+            )
+    return gen
+
+
 def genai_gen_image(model, prompt, num_inference_steps, generator=None, empty_adapters=False):
+    # The specialized closure lives on the model object itself (which already
+    # carries evaluator-assigned attributes like `resolution`) so the cache
+    # dies with the pipeline instead of keeping the previous model resident
+    # after `del base_model`.
+    gen = getattr(model, "_wwb_image_gen", None)
+    if gen is None:
+        gen = _make_image_gen(model)
+        try:
+            model._wwb_image_gen = gen
+        except AttributeError:
+            pass
+
     kwargs = {}
     if empty_adapters:
         import openvino_genai
         kwargs["adapters"] = openvino_genai.AdapterConfig()
 
-    if model.resolution is not None and model.resolution[0] is not None:
-        image_tensor = model.generate(
-            prompt,
-            width=model.resolution[0],
-            height=model.resolution[1],
-            num_inference_steps=num_inference_steps,
-            generator=generator,
-            **kwargs,
-        )
-    else:
-        image_tensor = model.generate(
-            prompt,
-            num_inference_steps=num_inference_steps,
-            generator=generator,
-            **kwargs,
-        )
-    return Image.fromarray(image_tensor.data[0])
+    image_tensor = gen(prompt, num_inference_steps, generator, **kwargs)
+    return _to_pil(image_tensor)
 
 
 def genai_gen_image2image(model, prompt, image, num_inference_steps, generator=None):
-    image_data = ov.Tensor(np.array(image)[None])
+    image_data, image_buf = _image_to_tensor(image)
     image_tensor = model.generate(
         prompt,
         image=image_data,
@@ -554,7 +663,8 @@ def genai_gen_image2image(model, prompt, image, num_inference_steps, generator=N
         strength=0.8,
         generator=generator,
     )
-    return Image.fromarray(image_tensor.data[0])
+    del image_buf  # the shared numpy buffer must outlive generate()
+    return _to_pil(image_tensor)
 
 
 def genai_gen_text2video(
@@ -570,6 +680,8 @@ def genai_gen_text2video(
     guidance_rescale=0,
     generator=None,
 ):
+    from PIL import Image
+
     kwargs = {"negative_prompt": negative_prompt} if guidance_scale > 1 else {}
     result = model.generate(
         prompt,
@@ -587,8 +699,8 @@ def genai_gen_text2video(
 
 
 def genai_gen_inpainting(model, prompt, image, mask, num_inference_steps, generator=None):
-    image_data = ov.Tensor(np.array(image)[None])
-    mask_data = ov.Tensor(np.array(mask)[None])
+    image_data, image_buf = _image_to_tensor(image)
+    mask_data, mask_buf = _image_to_tensor(mask)
     image_tensor = model.generate(
         prompt,
         image=image_data,
@@ -596,16 +708,22 @@ def genai_gen_inpainting(model, prompt, image, mask, num_inference_steps, genera
         num_inference_steps=num_inference_steps,
         generator=generator,
     )
-    return Image.fromarray(image_tensor.data[0])
+    del image_buf, mask_buf  # the shared numpy buffers must outlive generate()
+    return _to_pil(image_tensor)
 
 
 def genai_gen_visual_text(
     model, prompt, image, video, processor, tokenizer, max_new_tokens, crop_question, pruning_ratio, relevance_weight
 ):
+    from whowhatbench.visualtext_evaluator import fix_phi3_v_eos_token_id
+
     kwargs = {"do_sample": False, "max_new_tokens": max_new_tokens}
+    image_buf = None
     if image is not None:
-        kwargs['image'] = ov.Tensor(np.array(image)[None])
+        kwargs['image'], image_buf = _image_to_tensor(image)
     if video is not None:
+        import numpy as np
+        import openvino as ov
         kwargs['videos'] = [ov.Tensor(np.array(video))]
     if pruning_ratio is not None:
         kwargs["pruning_ratio"] = pruning_ratio
@@ -617,6 +735,7 @@ def genai_gen_visual_text(
         **fix_phi3_v_eos_token_id(model.config.model_type, tokenizer),
         **kwargs
     )
+    del image_buf  # the shared numpy buffer must outlive generate()
 
     return out.texts[0]
 
@@ -640,162 +759,167 @@ def create_evaluator(base_model, args):
     # TODO: Add logic to auto detect task based on model_id (TaskManager does not work for locally saved models)
     task = args.model_type
 
+    from whowhatbench import EVALUATOR_REGISTRY
+
     try:
         EvaluatorCLS = EVALUATOR_REGISTRY[task]
-        prompts = load_prompts(args)
+    except KeyError as e:
+        raise ValueError(
+            f"Attempted to load evaluator for '{task}', but no evaluator for this model type found! "
+            f"Supported model types: {', '.join(EVALUATOR_REGISTRY.keys())}"
+        ) from e
 
-        if task == "text":
-            tokenizer = load_tokenizer(args) if not args.llamacpp else None
+    prompts = load_prompts(args)
 
-            if args.genai:
-                gen_answer_fn = genai_gen_text
-            elif args.llamacpp:
-                gen_answer_fn = llamacpp_gen_text
-            else:
-                gen_answer_fn = None
+    if task == "text":
+        tokenizer = load_tokenizer(args) if not args.llamacpp else None
 
-            use_chat_template = (
-                tokenizer is not None and tokenizer.chat_template is not None and not args.omit_chat_template
-            )
-            return EvaluatorCLS(
-                base_model=base_model,
-                gt_data=args.gt_data,
-                test_data=prompts,
-                tokenizer=tokenizer,
-                similarity_model_id=args.data_encoder,
-                max_new_tokens=args.max_new_tokens,
-                num_samples=args.num_samples,
-                language=args.language,
-                gen_answer_fn=gen_answer_fn,
-                use_chat_template=use_chat_template,
-                long_prompt=args.long_prompt,
-                num_assistant_tokens=(
-                    int(args.num_assistant_tokens)
-                    if args.num_assistant_tokens is not None else 0
-                ),
-                assistant_confidence_threshold=(
-                    float(args.assistant_confidence_threshold)
-                    if args.assistant_confidence_threshold is not None else 0.0
-                ),
-            )
-        elif task == "text-to-image":
-            return EvaluatorCLS(
-                base_model=base_model,
-                gt_data=args.gt_data,
-                test_data=prompts,
-                num_samples=args.num_samples,
-                resolution=(args.image_size, args.image_size),
-                num_inference_steps=args.num_inference_steps,
-                empty_adapters=args.empty_adapters,
-                gen_image_fn=genai_gen_image if args.genai else None,
-                is_genai=args.genai,
-                seed=args.seed,
-            )
-        elif task == "text-to-video":
-            return EvaluatorCLS(
-                base_model=base_model,
-                gt_data=args.gt_data,
-                test_data=prompts,
-                num_samples=args.num_samples,
-                num_inference_steps=args.num_inference_steps,
-                num_frames=args.video_frames_num,
-                gen_video_fn=genai_gen_text2video if args.genai else None,
-                is_genai=args.genai,
-                seed=args.seed,
-            )
-        elif task == "visual-text" or task == "visual-video-text":
-            processor, config = load_processor(args)
-            tokenizer = processor.tokenizer if hasattr(processor, "tokenizer") else load_tokenizer(args)
-            if config and is_model_with_automatic_crop(config) and args.hf:
-                crop_question = False
-            else:
-                crop_question = True
-            return EvaluatorCLS(
-                base_model=base_model,
-                gt_data=args.gt_data,
-                test_data=prompts,
-                tokenizer=tokenizer,
-                num_samples=args.num_samples,
-                similarity_model_id=args.data_encoder,
-                max_new_tokens=args.max_new_tokens,
-                gen_answer_fn=genai_gen_visual_text if args.genai else None,
-                processor=processor,
-                crop_question=crop_question,
-                task_type=task,
-                frames_num=args.video_frames_num,
-                pruning_ratio=args.pruning_ratio,
-                relevance_weight=args.relevance_weight,
-            )
-        elif task == "image-to-image":
-            return EvaluatorCLS(
-                base_model=base_model,
-                gt_data=args.gt_data,
-                test_data=prompts,
-                num_samples=args.num_samples,
-                num_inference_steps=args.num_inference_steps,
-                gen_image_fn=genai_gen_image2image if args.genai else None,
-                is_genai=args.genai,
-                seed=args.seed,
-            )
-        elif task == "image-inpainting":
-            return EvaluatorCLS(
-                base_model=base_model,
-                gt_data=args.gt_data,
-                test_data=prompts,
-                num_samples=args.num_samples,
-                num_inference_steps=args.num_inference_steps,
-                gen_image_fn=genai_gen_inpainting if args.genai else None,
-                is_genai=args.genai,
-                seed=args.seed,
-            )
-        elif task == "text-embedding":
-            return EvaluatorCLS(
-                base_model=base_model,
-                tokenizer=load_tokenizer(args),
-                gt_data=args.gt_data,
-                test_data=prompts,
-                num_samples=args.num_samples,
-                gen_embeds_fn=genai_gen_embedding if args.genai else None,
-                pooling_type=args.embeds_pooling_type,
-                normalize=args.embeds_normalize,
-                padding_side=args.embeds_padding_side,
-                batch_size=args.embeds_batch_size,
-            )
-        elif task == "text-reranking":
-            return EvaluatorCLS(
-                base_model=base_model,
-                tokenizer=load_tokenizer(args),
-                gt_data=args.gt_data,
-                test_data=prompts,
-                num_samples=args.num_samples,
-                gen_rerank_fn=genai_gen_reranking if args.genai else None
-            )
+        if args.genai:
+            gen_answer_fn = genai_gen_text
+        elif args.llamacpp:
+            gen_answer_fn = llamacpp_gen_text
         else:
-            raise ValueError(f"Unsupported task: {task}")
-    except KeyError as e:
-        raise ValueError(
-            f"Attempted to load evaluator for '{task}', but no evaluator for this model type found! "
-            f"Supported model types: {', '.join(EVALUATOR_REGISTRY.keys())}. Details:\n",
-            e
+            gen_answer_fn = None
+
+        use_chat_template = (
+            tokenizer is not None and tokenizer.chat_template is not None and not args.omit_chat_template
+        )
+        return EvaluatorCLS(
+            base_model=base_model,
+            gt_data=args.gt_data,
+            test_data=prompts,
+            tokenizer=tokenizer,
+            similarity_model_id=args.data_encoder,
+            max_new_tokens=args.max_new_tokens,
+            num_samples=args.num_samples,
+            language=args.language,
+            gen_answer_fn=gen_answer_fn,
+            use_chat_template=use_chat_template,
+            long_prompt=args.long_prompt,
+            num_assistant_tokens=(
+                int(args.num_assistant_tokens)
+                if args.num_assistant_tokens is not None else 0
+            ),
+            assistant_confidence_threshold=(
+                float(args.assistant_confidence_threshold)
+                if args.assistant_confidence_threshold is not None else 0.0
+            ),
         )
+    elif task == "text-to-image":
+        return EvaluatorCLS(
+            base_model=base_model,
+            gt_data=args.gt_data,
+            test_data=prompts,
+            num_samples=args.num_samples,
+            resolution=(args.image_size, args.image_size),
+            num_inference_steps=args.num_inference_steps,
+            empty_adapters=args.empty_adapters,
+            gen_image_fn=genai_gen_image if args.genai else None,
+            is_genai=args.genai,
+            seed=args.seed,
+        )
+    elif task == "text-to-video":
+        return EvaluatorCLS(
+            base_model=base_model,
+            gt_data=args.gt_data,
+            test_data=prompts,
+            num_samples=args.num_samples,
+            num_inference_steps=args.num_inference_steps,
+            num_frames=args.video_frames_num,
+            gen_video_fn=genai_gen_text2video if args.genai else None,
+            is_genai=args.genai,
+            seed=args.seed,
+        )
+    elif task == "visual-text" or task == "visual-video-text":
+        processor, config = load_processor(args)
+        tokenizer = processor.tokenizer if hasattr(processor, "tokenizer") else load_tokenizer(args)
+        if config and is_model_with_automatic_crop(config) and args.hf:
+            crop_question = False
+        else:
+            crop_question = True
+        return EvaluatorCLS(
+            base_model=base_model,
+            gt_data=args.gt_data,
+            test_data=prompts,
+            tokenizer=tokenizer,
+            num_samples=args.num_samples,
+            similarity_model_id=args.data_encoder,
+            max_new_tokens=args.max_new_tokens,
+            gen_answer_fn=genai_gen_visual_text if args.genai else None,
+            processor=processor,
+            crop_question=crop_question,
+            task_type=task,
+            frames_num=args.video_frames_num,
+            pruning_ratio=args.pruning_ratio,
+            relevance_weight=args.relevance_weight,
+        )
+    elif task == "image-to-image":
+        return EvaluatorCLS(
+            base_model=base_model,
+            gt_data=args.gt_data,
+            test_data=prompts,
+            num_samples=args.num_samples,
+            num_inference_steps=args.num_inference_steps,
+            gen_image_fn=genai_gen_image2image if args.genai else None,
+            is_genai=args.genai,
+            seed=args.seed,
+        )
+    elif task == "image-inpainting":
+        return EvaluatorCLS(
+            base_model=base_model,
+            gt_data=args.gt_data,
+            test_data=prompts,
+            num_samples=args.num_samples,
+            num_inference_steps=args.num_inference_steps,
+            gen_image_fn=genai_gen_inpainting if args.genai else None,
+            is_genai=args.genai,
+            seed=args.seed,
+        )
+    elif task == "text-embedding":
+        return EvaluatorCLS(
+            base_model=base_model,
+            tokenizer=load_tokenizer(args),
+            gt_data=args.gt_data,
+            test_data=prompts,
+            num_samples=args.num_samples,
+            gen_embeds_fn=genai_gen_embedding if args.genai else None,
+            pooling_type=args.embeds_pooling_type,
+            normalize=args.embeds_normalize,
+            padding_side=args.embeds_padding_side,
+            batch_size=args.embeds_batch_size,
+        )
+    elif task == "text-reranking":
+        return EvaluatorCLS(
+            base_model=base_model,
+            tokenizer=load_tokenizer(args),
+            gt_data=args.gt_data,
+            test_data=prompts,
+            num_samples=args.num_samples,
+            gen_rerank_fn=genai_gen_reranking if args.genai else None
+        )
+    else:
+        raise ValueError(f"Unsupported task: {task}")
 
 
 def print_text_results(evaluator):
     metric_of_interest = "similarity"
     worst_examples = evaluator.worst_examples(
         top_k=5, metric=metric_of_interest)
+    matcher = difflib.SequenceMatcher(autojunk=False)
     for i, e in enumerate(worst_examples):
-        ref_text = ""
-        actual_text = ""
-        diff = ""
-        for l1, l2 in zip(
-            e["source_model"].splitlines(), e["optimized_model"].splitlines()
-        ):
-            if l1 == "" and l2 == "":
-                continue
-            ref_text += l1 + "\n"
-            actual_text += l2 + "\n"
-            diff += diff_strings(l1, l2) + "\n"
+        # zip_longest keeps the trailing lines of the longer text (plain zip
+        # silently dropped them), and the single joins replace the quadratic
+        # += string building.
+        pairs = [
+            (l1, l2, diff_strings(l1, l2, matcher=matcher))
+            for l1, l2 in itertools.zip_longest(
+                e["source_model"].splitlines(), e["optimized_model"].splitlines(), fillvalue=""
+            )
+            if not (l1 == "" and l2 == "")
+        ]
+        ref_text = "".join(p[0] + "\n" for p in pairs)
+        actual_text = "".join(p[1] + "\n" for p in pairs)
+        diff = "".join(p[2] + "\n" for p in pairs)
 
         logger.info(
             "======================================================================================================="
@@ -808,6 +932,8 @@ def print_text_results(evaluator):
 
 
 def print_image_results(evaluator):
+    import pandas as pd
+
     metric_of_interest = "similarity"
     pd.set_option('display.max_colwidth', None)
     worst_examples = evaluator.worst_examples(
@@ -851,10 +977,58 @@ def print_rag_results(evaluator):
         logger.info("## Difference in scores pre texts:\n%s\n", e["per_text_scores_diff"])
 
 
+def _warmup_hf_caches(args):
+    """
+    Best-effort priming of the lru_cache'd HF loaders so that create_evaluator
+    finds the tokenizer and config already deserialized. Errors are swallowed
+    here on purpose; create_evaluator reports them with full context.
+    """
+    if args.llamacpp:
+        return
+    try:
+        load_tokenizer(args)
+        model_id = args.base_model if args.base_model is not None else args.target_model
+        if model_id is not None and args.model_type in ("visual-text", "visual-video-text"):
+            try:
+                _cached_config(model_id, trust_remote_code=False)
+            except Exception:
+                _cached_config(model_id, trust_remote_code=True)
+    except Exception:
+        pass
+
+
+async def _load_base_model_parallel(args, kwargs):
+    from whowhatbench.model_loaders import load_model
+
+    # The base model load and the HF tokenizer/config reads are independent
+    # and IO-bound, so run them on worker threads and wait for both; on a
+    # cold cache the startup cost approaches max() of the two instead of
+    # their sum.
+    base_model, _ = await asyncio.gather(
+        asyncio.to_thread(
+            load_model,
+            args.model_type,
+            args.base_model,
+            args.device,
+            args.ov_config,
+            args.hf,
+            args.genai,
+            **kwargs,
+        ),
+        asyncio.to_thread(_warmup_hf_caches, args),
+    )
+    return base_model
+
+
 def main():
     args = parse_args()
     check_args(args)
 
+    import openvino as ov
+
+    from whowhatbench.model_loaders import load_model
+    from whowhatbench.utils import get_json_config
+
     version_str = f'openvino runtime version: {ov.get_version()}'
     if args.genai:
         try:
@@ -896,23 +1070,50 @@ def main():
             logger.info(f"draft_cb_config: {draft_cb_config}")
         kwargs["draft_cb_config"] = draft_cb_config
 
+    target_model_future = None
     if args.gt_data and os.path.exists(args.gt_data):
         evaluator = create_evaluator(None, args)
     else:
-        base_model = load_model(
-            args.model_type,
-            args.base_model,
-            args.device,
-            args.ov_config,
-            args.hf,
-            args.genai,
-            **kwargs,
-        )
-        evaluator = create_evaluator(base_model, args)
-
-        if args.gt_data:
-            evaluator.dump_gt(args.gt_data)
-        del base_model
+        executor = None
+        if (
+            args.target_model is not None
+            and not args.no_parallel_load
+            and not (args.target_data and os.path.exists(args.target_data))
+        ):
+            # Base and target loads are independent and dominated by disk and
+            # network IO, so fetch the target model on a worker thread while
+            # the main thread loads the base model.
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            target_model_future = executor.submit(
+                load_model,
+                args.model_type,
+                args.target_model,
+                args.device,
+                args.ov_config,
+                args.hf,
+                args.genai,
+                args.llamacpp,
+                **kwargs,
+            )
+        try:
+            base_model = asyncio.run(_load_base_model_parallel(args, kwargs))
+            evaluator = create_evaluator(base_model, args)
+
+            if args.gt_data:
+                evaluator.dump_gt(args.gt_data)
+            del base_model
+        except BaseException:
+            # Don't leave the worker loading a model nobody will consume:
+            # cancel the future if it has not started, otherwise wait for it
+            # and consume its outcome so the original error is what the user
+            # sees rather than an unretrieved-exception warning at exit.
+            if target_model_future is not None and not target_model_future.cancel():
+                concurrent.futures.wait([target_model_future])
+                target_model_future.exception()
+            raise
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
 
     if args.target_data or args.target_model:
         if args.target_data and os.path.exists(args.target_data):
@@ -922,16 +1123,19 @@ def main():
                 output_dir=args.output
             )
         else:
-            target_model = load_model(
-                args.model_type,
-                args.target_model,
-                args.device,
-                args.ov_config,
-                args.hf,
-                args.genai,
-                args.llamacpp,
-                **kwargs
-            )
+            if target_model_future is not None:
+                target_model = target_model_future.result()
+            else:
+                target_model = load_model(
+                    args.model_type,
+                    args.target_model,
+                    args.device,
+                    args.ov_config,
+                    args.hf,
+                    args.genai,
+                    args.llamacpp,
+                    **kwargs
+                )
             all_metrics_per_question, all_metrics = evaluator.score(
                 target_model,
                 evaluator.get_generation_fn() if args.genai or args.llamacpp else None,
@@ -941,12 +1145,28 @@ def main():
         logger.info(all_metrics)
 
         if args.output:
-            if not os.path.exists(args.output):
-                os.mkdir(args.output)
-            df = pd.DataFrame(all_metrics_per_question)
-            df.to_csv(os.path.join(args.output, "metrics_per_question.csv"))
+            import csv
+            import pandas as pd
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+
+            os.makedirs(args.output, exist_ok=True)
+            # Stream the per-question rows straight to disk instead of
+            # materializing a second copy of every text column in a pyarrow
+            # Table; only the small summary goes through pyarrow.
+            if isinstance(all_metrics_per_question, dict):
+                header = list(all_metrics_per_question.keys())
+                rows = zip(*all_metrics_per_question.values())
+            else:
+                header = list(all_metrics_per_question.columns)
+                rows = all_metrics_per_question.itertuples(index=False, name=None)
+            with open(os.path.join(args.output, "metrics_per_question.csv"), "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                writer.writerows(rows)
             df = pd.DataFrame(all_metrics)
-            df.to_csv(os.path.join(args.output, "metrics.csv"))
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False),
+                            os.path.join(args.output, "metrics.csv"))
             evaluator.dump_predictions(os.path.join(args.output, "target.csv"))
 
     if args.verbose and (args.target_model or args.target_data):